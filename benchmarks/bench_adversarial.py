@@ -0,0 +1,70 @@
+"""Worst-case cronslate latency on adversarial input of growing size.
+
+Run from the repository root:
+
+    python benchmarks/bench_adversarial.py
+
+Each row is one crafted input shape, each column an input size. With the
+length cap disabled the timings should grow linearly with the size: the
+last column is the ratio between the two largest sizes, about 4x for a
+linear scan and 16x for a quadratic one. With the default cap, oversized
+input is rejected before it is scanned.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pyslop.cronslator.cronslator import MAX_DESCRIPTION_LENGTH, cronslate
+
+SIZES = [1_000, 4_000, 16_000, 64_000]
+REPEAT = 5
+
+ADVERSARIAL = {
+    "digit run": lambda n: "1" * n,
+    "every + digit run": lambda n: "every " + "1" * n + "x",
+    "digit run + day": lambda n: "9" * n + " x day",
+    "digit run + suffix": lambda n: "1" * n + "x",
+    "between + spaces": lambda n: "between 1" + " " * n + "x",
+    "time + spaces": lambda n: ("1" + " " * 50) * (n // 51),
+    "comma list": lambda n: "times per hour " + ", 1" * (n // 3),
+    "weekday soup": lambda n: "monday and " * (n // 11),
+}
+
+
+def worst_case(description: str, max_length) -> float:
+    worst = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        try:
+            cronslate(description, max_length=max_length)
+        except ValueError:
+            pass
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def report(title: str, max_length) -> None:
+    print(title)
+    sizes = "".join(f"{n:>12,}" for n in SIZES)
+    print(f"{'input':<22}{sizes}{'ratio':>9}")
+    for name, build in ADVERSARIAL.items():
+        timings = [worst_case(build(n), max_length) for n in SIZES]
+        ratio = timings[-1] / timings[-2] if timings[-2] else float("nan")
+        print(
+            f"{name:<22}"
+            + "".join(f"{t * 1e3:>10.3f}ms" for t in timings)
+            + f"{ratio:>8.1f}x"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    report("Uncapped (max_length=None), worst of %d runs" % REPEAT, None)
+    report(
+        "Default cap (max_length=%d), worst of %d runs"
+        % (MAX_DESCRIPTION_LENGTH, REPEAT),
+        MAX_DESCRIPTION_LENGTH,
+    )
@@ -0,0 +1,66 @@
+"""cronslate throughput against thread count.
+
+Run from the repository root, on a standard and a free-threaded build:
+
+    python benchmarks/bench_threads.py
+    python3.13t benchmarks/bench_threads.py
+
+Translation is CPU-bound, so with the GIL throughput stays roughly flat
+as threads are added. The uncached column measures parsing itself, the
+cached one the shared translation cache.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pyslop.cronslator import cronslate_threaded
+
+SCHEDULES = [
+    "Every Monday at 3am",
+    "Every weekday at noon",
+    "Every 15 minutes",
+    "First day of every month at midnight",
+    "Every Sunday at 4:30 PM",
+    "Every day at 2am and 2pm",
+    "Every 30 minutes between 9am and 5pm on weekdays",
+    "First Monday of every month at 3am",
+    "Every weekend at 10pm",
+    "Every weekday at 9am, 1pm and 5pm",
+    "Three times per hour at 15, 30, and 45 minutes",
+    "Last day of month at 11:59 PM",
+]
+DESCRIPTIONS = SCHEDULES * 5_000
+THREADS = [1, 2, 4, 8, 16]
+CHUNKSIZE = 512
+
+
+def throughput(threads: int, cached: bool) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # Warm up the pool threads and, for the cached run, the cache
+        cronslate_threaded(SCHEDULES, executor=executor, cached=cached)
+        start = time.perf_counter()
+        cronslate_threaded(
+            DESCRIPTIONS, executor=executor, chunksize=CHUNKSIZE, cached=cached
+        )
+        return len(DESCRIPTIONS) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    gil = "enabled" if getattr(sys, "_is_gil_enabled", lambda: True)() else "disabled"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}")
+    print(f"{os.cpu_count()} CPUs, {len(DESCRIPTIONS):,} descriptions per run")
+    print("threads".rjust(8) + "uncached/s".rjust(14) + "speedup".rjust(9), end="")
+    print("cached/s".rjust(14) + "speedup".rjust(9))
+    base = {}
+    for threads in THREADS:
+        row = f"{threads:>8}"
+        for cached in [False, True]:
+            rate = throughput(threads, cached)
+            base.setdefault(cached, rate)
+            row += f"{rate:>14,.0f}{rate / base[cached]:>8.2f}x"
+        print(row)
@@ -1,3 +1,22 @@
-from .cronslator import cronslate
+from .cronslator import cronslate, cronslate_batch
+from .crontab import regenerate_crontab
+from .pool import cronslate_threaded
+from .streaming import translate_file
 
-__all__ = ["cronslate"]
+__all__ = [
+    "acronslate",
+    "cronslate",
+    "cronslate_batch",
+    "cronslate_threaded",
+    "regenerate_crontab",
+    "translate_file",
+]
+
+
+def __getattr__(name):
+    # acronslate pulls in asyncio, which the CLI and sync callers never need
+    if name == "acronslate":
+        from .aio import acronslate
+
+        return acronslate
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
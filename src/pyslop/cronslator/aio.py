@@ -0,0 +1,111 @@
+import asyncio
+from concurrent.futures import Executor
+from contextlib import suppress
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+
+from .cronslator import cronslate_batch
+
+
+async def acronslate(
+    descriptions: AsyncIterable[str],
+    batch_size: int = 256,
+    max_pending: int = 4,
+    max_delay: Optional[float] = 0.05,
+    executor: Optional[Executor] = None,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Union[str, ValueError]]:
+    """Translate an async stream of descriptions without blocking the loop.
+
+    Descriptions are grouped into batches of ``batch_size`` and each batch
+    is translated in ``executor`` (the loop's default executor if None)
+    through the shared translation cache. At most ``max_pending`` batches
+    are in flight, counting from when reading a batch from ``descriptions``
+    starts until its last result has been yielded; beyond that, reading
+    waits, so a burst never piles up in memory. A batch is submitted once
+    it is full, the stream ends, or ``max_delay`` seconds have passed since
+    its first description arrived without the next one arriving; with
+    ``max_delay`` None a partial batch waits until it fills up.
+
+    Results are yielded in input order. A description that cannot be
+    translated raises its ValueError, or is yielded as the exception when
+    ``return_exceptions`` is set. When iteration stops early, batches not
+    yet started are cancelled and ``descriptions`` is closed.
+    """
+    if batch_size < 1 or max_pending < 1:
+        raise ValueError("batch_size and max_pending must be positive")
+    if max_delay is not None and max_delay < 0:
+        raise ValueError("max_delay must not be negative")
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max_pending)
+    pending: asyncio.Queue = asyncio.Queue()
+    source = descriptions.__aiter__()
+
+    async def produce():
+        exhausted = False
+        # The pending read survives a timed-out wait, so a late description
+        # starts the next batch instead of being cancelled and lost
+        next_item = None
+        try:
+            while not exhausted:
+                await slots.acquire()
+                batch = []
+                deadline = None
+                while len(batch) < batch_size:
+                    if next_item is None:
+                        next_item = asyncio.ensure_future(source.__anext__())
+                    timeout = None
+                    if deadline is not None:
+                        timeout = max(deadline - loop.time(), 0)
+                    done, _ = await asyncio.wait({next_item}, timeout=timeout)
+                    if not done:
+                        break
+                    item, next_item = next_item, None
+                    try:
+                        batch.append(item.result())
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    if deadline is None and max_delay is not None:
+                        deadline = loop.time() + max_delay
+                if batch:
+                    pending.put_nowait(
+                        loop.run_in_executor(executor, cronslate_batch, batch, True)
+                    )
+                else:
+                    slots.release()
+        except Exception as e:
+            failed = loop.create_future()
+            failed.set_exception(e)
+            pending.put_nowait(failed)
+        finally:
+            if next_item is not None:
+                next_item.cancel()
+                await asyncio.wait({next_item})
+                if not next_item.cancelled():
+                    next_item.exception()
+        pending.put_nowait(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            batch = await pending.get()
+            if batch is None:
+                break
+            for result in await batch:
+                if isinstance(result, ValueError) and not return_exceptions:
+                    raise result
+                yield result
+            slots.release()
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
+        while not pending.empty():
+            batch = pending.get_nowait()
+            if batch is not None and not batch.cancel():
+                # Already finished; retrieve any error so it is not reported
+                batch.exception()
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
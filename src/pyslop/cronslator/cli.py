@@ -1,5 +1,8 @@
+import argparse
 import sys
 from pyslop.cronslator import cronslate
+from pyslop.cronslator.crontab import ANNOTATION_MARKER, regenerate_crontab
+from pyslop.cronslator.streaming import translate_file
 
 
 def print_usage():
@@ -7,9 +10,64 @@ def print_usage():
     print("  cronslate 'Every Monday at 3am'", file=sys.stderr)
     print("  cronslate Every Monday at 3am", file=sys.stderr)
     print("  echo 'Every Monday at 3am' | cronslate", file=sys.stderr)
+    print(
+        "  cronslate --file schedules.txt [--offset N --length N] [--offsets]",
+        file=sys.stderr,
+    )
+    print("  cronslate --crontab crontab.txt [--any-comment]", file=sys.stderr)
+
+
+def main_file(args):
+    parser = argparse.ArgumentParser(prog="cronslate")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--file", help="one description per line")
+    mode.add_argument("--crontab", help="regenerate schedules from comments")
+    parser.add_argument("--offset", type=int, default=None, help="shard start byte")
+    parser.add_argument("--length", type=int, default=None, help="shard size in bytes")
+    parser.add_argument(
+        "--offsets", action="store_true", help="prefix results with input offsets"
+    )
+    parser.add_argument(
+        "--any-comment",
+        action="store_true",
+        help="read plain comments as schedules, not only 'cronslate:' ones",
+    )
+    options = parser.parse_args(args)
+    if options.crontab and (
+        options.offset is not None or options.length is not None or options.offsets
+    ):
+        parser.error("--offset, --length and --offsets only apply to --file")
+    if options.file and options.any_comment:
+        parser.error("--any-comment only applies to --crontab")
+
+    failed = 0
+    try:
+        if options.crontab:
+            marker = None if options.any_comment else ANNOTATION_MARKER
+            with open(options.crontab, "rb") as source:
+                regenerate_crontab(source, sys.stdout.buffer, marker=marker)
+        else:
+            _, failed = translate_file(
+                options.file,
+                sys.stdout.buffer,
+                options.offset or 0,
+                options.length,
+                options.offsets,
+            )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
 
 
 def main():
+    # Bulk translation of a file, one description per line
+    if len(sys.argv) > 1 and sys.argv[1].startswith("--"):
+        sys.stdout.flush()
+        main_file(sys.argv[1:])
+        return
+
     # Check if input is being piped
     if not sys.stdin.isatty():
         try:
@@ -1,6 +1,81 @@
 import re
 from dataclasses import dataclass
-from typing import Optional, Dict, List, Set
+from functools import wraps
+from typing import Callable, Iterable, Optional, Dict, List, Set, Union
+
+# Longest description cronslate accepts by default. The patterns used to
+# parse a description match in linear time; the cap bounds the constant.
+MAX_DESCRIPTION_LENGTH = 1024
+
+# Patterns are compiled once at import. A pattern string passed to
+# re.search() is looked up in re's module-wide pattern cache on every call,
+# which builds a key each time and, on a miss of its small fast cache,
+# updates the shared fallback cache. Precompiled patterns avoid both.
+NUMBER_PATTERN = re.compile(r"\d+")
+TIME_PATTERN = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?(?=\s|$|,|\sand\s)")
+TIME_RANGE_PATTERN = re.compile(
+    r"between\s+(\d{1,2}(?::\d{2})?(?:\s*[ap]m)?)\s+and\s+"
+    r"(\d{1,2}(?::\d{2})?(?:\s*[ap]m)?)"
+)
+INTERVAL_PATTERN = re.compile(r"every\s+(\d+)")
+MINUTE_INTERVAL_PATTERN = re.compile(r"every\s+(\d+)\s+minute")
+NTH_DAY_PATTERN = re.compile(
+    r"(?:every\s+)?((?<!\d)\d+|fourth?|third?|second?|first|one|two|three|four|five|six|seven|eight|nine|ten)\s+(?:days?|day)",
+    re.IGNORECASE,
+)
+ORDINAL_WEEKDAY_PATTERN = re.compile(
+    r"(first|second|third|fourth|fifth)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
+    re.IGNORECASE,
+)
+ORDINAL_DAY_PATTERN = re.compile(r"(?<!\d)(\d+)(?:st|nd|rd|th)")
+
+# Enhanced input validation
+INVALID_PATTERNS = [
+    re.compile(r"\d{2}:\d{2}:\d{2}"),  # No seconds
+    re.compile(r"(?:^|\s)(?:2[4-9]|[3-9]\d):[0-5]\d"),  # Invalid hours
+    re.compile(r"day\s+(?:0|3[2-9]|[4-9]\d)"),  # Invalid days
+    re.compile("nananosecond"),
+    re.compile("invalid"),
+]
+
+
+def memoize(maxsize: int) -> Callable:
+    """Bounded memo for single-argument functions, safe to share across threads.
+
+    Unlike functools.lru_cache, a hit is a plain dict read and does not
+    update any recency order. When full, the oldest entry is evicted in
+    insertion order, as re's pattern cache does, so a busy entry may be
+    evicted and recomputed. Exceptions are not memoized.
+
+    Threads inserting at the same moment can each add an entry after the
+    size check, so the memo may briefly hold one extra entry per such
+    thread; the next insert evicts back below ``maxsize``.
+    """
+
+    def decorator(func):
+        memo = {}
+
+        @wraps(func)
+        def wrapper(key):
+            try:
+                return memo[key]
+            except KeyError:
+                pass
+            result = func(key)
+            while len(memo) >= maxsize:
+                # Another thread may evict or insert concurrently
+                try:
+                    del memo[next(iter(memo))]
+                except (StopIteration, RuntimeError, KeyError):
+                    break
+            memo[key] = result
+            return result
+
+        wrapper.cache_clear = memo.clear
+        wrapper.cache_len = memo.__len__
+        return wrapper
+
+    return decorator
 
 
 @dataclass
@@ -93,8 +168,7 @@ class BasicParser:
     @staticmethod
     def parse_minutes_list(text: str) -> list[str]:
         """Extract multiple minute values from text."""
-        minutes = []
-        minute_matches = re.findall(r"(?:(?:,\s*)?(\d+)(?:\s*,|\s+and\s+)?)", text)
+        minute_matches = NUMBER_PATTERN.findall(text)
         return [m for m in minute_matches if 0 <= int(m) <= 59]
 
     @staticmethod
@@ -122,9 +196,7 @@ class BasicParser:
     def parse_am_pm_times(text: str) -> list[tuple[int, int]]:
         """Parse all times with proper AM/PM context."""
         results = []
-        time_tokens = re.finditer(
-            r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?(?=\s|$|,|\sand\s)", text.lower()
-        )
+        time_tokens = TIME_PATTERN.finditer(text.lower())
 
         current_meridiem = None
         for match in time_tokens:
@@ -161,11 +233,7 @@ class BasicParser:
     @staticmethod
     def parse_time_range(text: str) -> tuple[int, int]:
         """Parse time range and return start and end hours."""
-        range_match = re.search(
-            r"between\s+(\d{1,2}(?::\d{2})?(?:\s*[ap]m)?)\s+and\s+"
-            r"(\d{1,2}(?::\d{2})?(?:\s*[ap]m)?)",
-            text,
-        )
+        range_match = TIME_RANGE_PATTERN.search(text)
         if not range_match:
             return -1, -1
         start_hour, _ = BasicParser.parse_time(range_match.group(1))
@@ -187,7 +255,7 @@ class BasicParser:
     def handle_business_hours(description: str) -> tuple[str, str, str]:
         """Handle business hours patterns. Returns (minute, hour, day_of_week)"""
         if "business hours" in description:
-            interval_match = re.search(r"every\s+(\d+)\s+minute", description)
+            interval_match = MINUTE_INTERVAL_PATTERN.search(description)
             if interval_match:
                 return f"*/{interval_match.group(1)}", "9-17", "1-5"
         return "*", "*", "*"
@@ -231,7 +299,7 @@ class CronParser:
     def _handle_intervals(self, desc: str, comp: CronComponents) -> bool:
         # Simple interval handling
         if "every" in desc and "minute" in desc:
-            match = re.search(r"every\s+(\d+)", desc)
+            match = INTERVAL_PATTERN.search(desc)
             if match:
                 comp.minute = f"*/{match.group(1)}"
                 return True
@@ -240,23 +308,27 @@ class CronParser:
     # Additional methods would go here, each handling specific patterns
 
 
-def cronslate(description: str) -> str:
+def cronslate(
+    description: str,
+    max_length: Optional[int] = MAX_DESCRIPTION_LENGTH,
+    fuzzy: bool = False,
+) -> str:
     if not description or not isinstance(description, str):
         raise ValueError("Invalid or empty description")
 
-    # Enhanced input validation
-    invalid_patterns = [
-        r"\d{2}:\d{2}:\d{2}",  # No seconds
-        r"(?:^|\s)(?:2[4-9]|[3-9]\d):[0-5]\d",  # Invalid hours
-        r"day\s+(?:0|3[2-9]|[4-9]\d)",  # Invalid days
-        "nananosecond",
-        "invalid",
-    ]
+    # Reject oversized input before any scanning; None disables the cap
+    if max_length is not None and len(description) > max_length:
+        raise ValueError(f"Description longer than {max_length} characters")
 
-    if any(re.search(pattern, description.lower()) for pattern in invalid_patterns):
+    description = description.lower()
+    if any(pattern.search(description) for pattern in INVALID_PATTERNS):
         raise ValueError("Invalid time specification")
 
-    description = description.lower().strip()
+    description = description.strip()
+    if fuzzy:
+        from .fuzzy import correct_typos
+
+        description = correct_typos(description)
     components = CronComponents()
     context = {}  # Store pattern matching context
 
@@ -278,7 +350,7 @@ def cronslate(description: str) -> str:
 
     # Handle intervals first - this is highest priority
     if "every" in description and "minute" in description:
-        interval_match = re.search(r"every\s+(\d+)\s+minute", description)
+        interval_match = MINUTE_INTERVAL_PATTERN.search(description)
         if interval_match:
             interval = interval_match.group(1)
             components.minute = f"*/{interval}"
@@ -350,11 +422,7 @@ def cronslate(description: str) -> str:
         components.hour = special_hour
 
     # Handle every Nth day pattern (add this before monthly patterns)
-    nth_day_match = re.search(
-        r"(?:every\s+)?(\d+|fourth?|third?|second?|first|one|two|three|four|five|six|seven|eight|nine|ten)\s+(?:days?|day)",
-        description,
-        re.IGNORECASE,
-    )
+    nth_day_match = NTH_DAY_PATTERN.search(description)
     if nth_day_match:
         interval = nth_day_match.group(1)
         if interval in BasicParser.ORDINALS:
@@ -369,11 +437,7 @@ def cronslate(description: str) -> str:
             raise ValueError(f"Invalid day interval: {interval}")
 
     # Add before other monthly patterns
-    ordinal_day_match = re.search(
-        r"(first|second|third|fourth|fifth)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-        description,
-        re.IGNORECASE,
-    )
+    ordinal_day_match = ORDINAL_WEEKDAY_PATTERN.search(description)
     if ordinal_day_match:
         ordinal = BasicParser.ORDINALS[ordinal_day_match.group(1).lower()]
         weekday = BasicParser.WEEKDAYS[ordinal_day_match.group(2).lower()]
@@ -396,7 +460,7 @@ def cronslate(description: str) -> str:
         components.day_of_month = "1-7"
         components.day_of_week = "1"
     else:
-        ordinal_match = re.search(r"(\d+)(?:st|nd|rd|th)", description)
+        ordinal_match = ORDINAL_DAY_PATTERN.search(description)
         if ordinal_match:
             day = int(ordinal_match.group(1))
             if not (1 <= day <= 31):
@@ -431,3 +495,35 @@ def cronslate(description: str) -> str:
         components.month = context["month"]
 
     return str(components)
+
+
+_memoized_cronslate = memoize(maxsize=4096)(cronslate)
+
+
+def cached_cronslate(description: str) -> str:
+    """Memoized cronslate, shared by the bulk translation APIs."""
+    # Checked before the lookup, which would raise TypeError on unhashables
+    if not isinstance(description, str):
+        raise ValueError("Invalid or empty description")
+    return _memoized_cronslate(description)
+
+
+def cronslate_batch(
+    descriptions: Iterable[str], return_exceptions: bool = False, cached: bool = True
+) -> List[Union[str, ValueError]]:
+    """Translate many descriptions, in order, through the shared cache.
+
+    With ``return_exceptions`` a ValueError is returned in place of the
+    failed description's result instead of being raised. ``cached=False``
+    bypasses the cache.
+    """
+    translate = cached_cronslate if cached else cronslate
+    results = []
+    for description in descriptions:
+        try:
+            results.append(translate(description))
+        except ValueError as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
@@ -0,0 +1,119 @@
+import io
+import re
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from .cronslator import cronslate
+from .streaming import WRITE_BUFFER_SIZE
+
+# By default only comments starting with this marker are read as schedule
+# descriptions, e.g. "# cronslate: every weekday at 9am". cronslate is
+# lenient and reads a schedule into most text with a number, so accepting
+# plain comments is opt-in.
+ANNOTATION_MARKER = b"cronslate:"
+
+# cronslate falls back to this for text it does not recognise, so an
+# annotation that translates to it is left alone
+WILDCARD_SCHEDULE = b"* * * * *"
+
+# Leading whitespace, the five schedule fields, and the rest of the job line
+JOB_LINE = re.compile(rb"([ \t]*)([0-9*]\S*(?:[ \t]+\S+){4})([ \t].*)")
+
+
+def annotation(
+    comment: bytes, marker: Optional[bytes] = ANNOTATION_MARKER
+) -> Optional[bytes]:
+    """Schedule description in a comment's text, or None if it has none.
+
+    With ``marker`` None, any comment is taken as a description.
+    """
+    if marker is not None:
+        if not comment.startswith(marker):
+            return None
+        comment = comment[len(marker) :]
+    description = comment.strip()
+    # A commented-out job is not a description, even behind the marker
+    if not description or JOB_LINE.fullmatch(b" " + description):
+        return None
+    return description
+
+
+def regenerate_crontab(
+    source: BinaryIO,
+    output: BinaryIO,
+    cache: Optional[Dict[bytes, Optional[bytes]]] = None,
+    marker: Optional[bytes] = ANNOTATION_MARKER,
+) -> Tuple[int, int]:
+    """Regenerate schedule fields of a crontab from the comments above them.
+
+    A job line directly preceded by an annotation comment such as
+    ``# cronslate: every weekday at 9am`` gets its five schedule fields
+    replaced by ``cronslate`` of that comment. All other lines, including
+    plain comments, annotations that do not translate to a schedule and
+    jobs whose fields already match, are copied byte-for-byte.
+
+    Pass ``marker=None`` to read every comment directly above a job as its
+    description, as in ``# every weekday at 9am``. Commented-out jobs and
+    comments that translate to ``* * * * *`` are still ignored.
+
+    Translations are kept in ``cache``, keyed by the annotation text, so
+    repeated annotations are translated once. The cache only lives as long
+    as the dict passed in; nothing is persisted between runs.
+    Returns ``(updated, unchanged)`` counts of annotated job lines.
+    """
+    if cache is None:
+        cache = {}
+    writer = io.BufferedWriter(output, buffer_size=WRITE_BUFFER_SIZE)
+    try:
+        return _regenerate(source, writer, cache, marker)
+    finally:
+        writer.flush()
+        writer.detach()
+
+
+def _regenerate(
+    source: BinaryIO,
+    output: BinaryIO,
+    cache: Dict[bytes, Optional[bytes]],
+    marker: Optional[bytes],
+) -> Tuple[int, int]:
+    updated = unchanged = 0
+    description = None
+
+    for line in source:
+        body = line.rstrip(b"\r\n")
+        stripped = body.lstrip()
+
+        if stripped.startswith(b"#"):
+            description = annotation(stripped.lstrip(b"#").strip(), marker)
+            output.write(line)
+            continue
+
+        match = JOB_LINE.fullmatch(body) if description else None
+        if match is None:
+            description = None
+            output.write(line)
+            continue
+
+        if description in cache:
+            schedule = cache[description]
+        else:
+            try:
+                schedule = cronslate(description.decode("utf-8", "replace"))
+                schedule = schedule.encode("ascii")
+            except ValueError:
+                schedule = None
+            if schedule == WILDCARD_SCHEDULE:
+                schedule = None
+            cache[description] = schedule
+        description = None
+
+        if schedule is None or schedule.split() == match.group(2).split():
+            unchanged += 1
+            output.write(line)
+        else:
+            updated += 1
+            output.write(
+                match.group(1) + schedule + match.group(3) + line[len(body) :]
+            )
+
+    return updated, unchanged
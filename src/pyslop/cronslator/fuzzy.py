@@ -0,0 +1,154 @@
+import re
+from typing import Dict, Iterable, Set
+
+from .cronslator import BasicParser, memoize
+
+
+def deletions(word: str, max_distance: int) -> Set[str]:
+    """All strings reachable from ``word`` by up to ``max_distance`` deletions."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def osa_distance(a: str, b: str) -> int:
+    """Edit distance counting insertions, deletions, substitutions and
+    adjacent transpositions (optimal string alignment)."""
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if (
+                previous2 is not None
+                and i > 1
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+class DeletionIndex:
+    """Vocabulary index for bounded edit-distance lookups.
+
+    Every word is stored under each string obtained by deleting up to
+    ``max_distance`` of its characters. Two words within that distance of
+    each other share at least one such variant, so a lookup only probes
+    the query's own deletion variants and verifies the few words found,
+    instead of comparing the query against the whole vocabulary.
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = 1):
+        self.max_distance = max_distance
+        self.words = frozenset(words)
+        self._variants: Dict[str, Set[str]] = {}
+        for word in self.words:
+            for variant in deletions(word, max_distance):
+                self._variants.setdefault(variant, set()).add(word)
+
+    def matches(self, token: str) -> Dict[str, int]:
+        """Vocabulary words within ``max_distance`` of ``token``, with distances."""
+        if token in self.words:
+            return {token: 0}
+        candidates = set()
+        for variant in deletions(token, self.max_distance):
+            candidates |= self._variants.get(variant, set())
+        found = {}
+        for word in candidates:
+            distance = osa_distance(token, word)
+            if distance <= self.max_distance:
+                found[word] = distance
+        return found
+
+
+# Spelled-out vocabulary; short words like "one" or "six" are too close to
+# ordinary words to correct reliably
+VOCABULARY_INDEX = DeletionIndex(
+    word
+    for word in [*BasicParser.WEEKDAYS, *BasicParser.ORDINALS, *BasicParser.NUMBERS]
+    if word.isalpha() and len(word) >= 5
+)
+
+# Real words one typo away from the vocabulary, such as the tens ("eighty"
+# is one deletion from "eight") and plurals ("mondays", "seconds"). They are
+# never corrected.
+NEVER_CORRECT = frozenset(
+    [
+        "thirty",
+        "forty",
+        "fifty",
+        "sixty",
+        "seventy",
+        "eighty",
+        "ninety",
+        "there",
+        *(word + "s" for word in VOCABULARY_INDEX.words),
+    ]
+)
+
+# Only words where the parser looks for vocabulary are corrected: after one
+# of these tokens, or before a "day" or a weekday ("every thrid day",
+# "frist monday"). Words elsewhere in the description are left alone.
+LEADING_CONTEXT = {"every", "on", "and", ","}
+TRAILING_CONTEXT = {"day", "days", *BasicParser.WEEKDAYS}
+
+# One wrong letter turns many short words into vocabulary ("sundae",
+# "teeth"), so substitutions are only corrected in longer words
+MIN_SUBSTITUTION_LENGTH = 7
+
+TOKEN_PATTERN = re.compile(r"[a-z]+|,")
+
+
+def is_substitution(a: str, b: str) -> bool:
+    """Whether ``a`` and ``b`` differ by exactly one replaced character."""
+    return len(a) == len(b) and sum(x != y for x, y in zip(a, b)) == 1
+
+
+@memoize(maxsize=4096)
+def correct_token(token: str) -> str:
+    """Closest vocabulary word to ``token``, or ``token`` if none is unambiguous."""
+    if token in NEVER_CORRECT:
+        return token
+    matches = {
+        word: distance
+        for word, distance in VOCABULARY_INDEX.matches(token).items()
+        if len(token) >= MIN_SUBSTITUTION_LENGTH or not is_substitution(token, word)
+    }
+    if not matches:
+        return token
+    best = min(matches.values())
+    closest = [word for word, distance in matches.items() if distance == best]
+    return closest[0] if len(closest) == 1 else token
+
+
+def correct_typos(description: str) -> str:
+    """Replace misspelt weekdays, ordinals and numbers in a lowercase
+    description with their spelling."""
+    tokens = list(TOKEN_PATTERN.finditer(description))
+    parts = []
+    end = 0
+    for i, match in enumerate(tokens):
+        token = match.group(0)
+        previous = tokens[i - 1].group(0) if i > 0 else None
+        following = tokens[i + 1].group(0) if i + 1 < len(tokens) else None
+        if len(token) < 5 or (
+            previous not in LEADING_CONTEXT and following not in TRAILING_CONTEXT
+        ):
+            continue
+        parts.append(description[end : match.start()])
+        parts.append(correct_token(token))
+        end = match.end()
+    parts.append(description[end:])
+    return "".join(parts)
@@ -0,0 +1,46 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+
+from .cronslator import cronslate_batch
+
+
+def chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def cronslate_threaded(
+    descriptions: Iterable[str],
+    max_workers: Optional[int] = None,
+    chunksize: int = 256,
+    executor: Optional[Executor] = None,
+    return_exceptions: bool = False,
+    cached: bool = True,
+) -> List[Union[str, ValueError]]:
+    """Translate descriptions on a thread pool, returning results in order.
+
+    Descriptions are split into chunks of ``chunksize``, one task per
+    chunk, so pool overhead is paid per chunk rather than per description.
+    With ``cached`` the threads share the memo behind ``cached_cronslate``;
+    with ``cached=False`` each description goes through plain ``cronslate``,
+    which keeps no state between calls. Pass ``executor`` to reuse an
+    existing pool; otherwise one is created for the call.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    def translate(chunk):
+        return cronslate_batch(chunk, return_exceptions, cached)
+
+    if executor is not None:
+        chunks = executor.map(translate, chunked(descriptions, chunksize))
+        return [result for chunk in chunks for result in chunk]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        chunks = pool.map(translate, chunked(descriptions, chunksize))
+        return [result for chunk in chunks for result in chunk]
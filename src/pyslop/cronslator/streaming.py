@@ -0,0 +1,89 @@
+import io
+import mmap
+import os
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from .cronslator import cronslate
+
+# Output buffer for bulk translation; large enough that the writer only
+# reaches the underlying stream every few thousand records.
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def shard_bounds(
+    mm: mmap.mmap, offset: int = 0, length: Optional[int] = None
+) -> Tuple[int, int]:
+    """Align a byte range to line boundaries.
+
+    A line belongs to the shard that contains its first byte, so shards
+    built from adjacent ``offset``/``length`` pairs never overlap or drop
+    lines, whatever the split points are.
+    """
+    size = len(mm)
+    if offset < 0 or (length is not None and length < 0):
+        raise ValueError("Offset and length must be non-negative")
+
+    start = min(offset, size)
+    if 0 < start < size and mm[start - 1] != ord("\n"):
+        newline = mm.find(b"\n", start)
+        start = size if newline == -1 else newline + 1
+
+    end = size if length is None else min(offset + length, size)
+    if start < end and mm[end - 1] != ord("\n"):
+        newline = mm.find(b"\n", end)
+        end = size if newline == -1 else newline + 1
+
+    return start, max(start, end)
+
+
+def iter_records(mm: mmap.mmap, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(position, record)`` for each non-blank line in ``mm[start:end]``."""
+    pos = start
+    while pos < end:
+        newline = mm.find(b"\n", pos, end)
+        stop = end if newline == -1 else newline
+        record = mm[pos:stop].strip()
+        if record:
+            yield pos, record
+        pos = stop + 1
+
+
+def translate_file(
+    path: str,
+    output: BinaryIO,
+    offset: int = 0,
+    length: Optional[int] = None,
+    with_offsets: bool = False,
+) -> Tuple[int, int]:
+    """Translate one description per line of ``path`` into ``output``.
+
+    The input is memory-mapped and read record by record, so the file is
+    never loaded as a whole. Each non-blank line produces one output line:
+    the cron expression, or ``Error: <message>`` for descriptions that
+    cannot be translated. With ``with_offsets`` each output line is
+    prefixed by the byte offset of its input line and a tab, so results
+    from several shards can be matched back to the file.
+    Returns ``(translated, failed)`` counts.
+    """
+    translated = failed = 0
+    writer = io.BufferedWriter(output, buffer_size=WRITE_BUFFER_SIZE)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return translated, failed
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, end = shard_bounds(mm, offset, length)
+                for position, record in iter_records(mm, start, end):
+                    try:
+                        result = cronslate(record.decode("utf-8", "replace"))
+                        translated += 1
+                    except ValueError as e:
+                        result = f"Error: {e}"
+                        failed += 1
+                    if with_offsets:
+                        result = f"{position}\t{result}"
+                    writer.write(result.encode("utf-8") + b"\n")
+    finally:
+        writer.flush()
+        writer.detach()
+    return translated, failed
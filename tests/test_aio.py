@@ -0,0 +1,202 @@
+import asyncio
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyslop.cronslator import acronslate, cronslate_batch
+
+
+ENV = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+SCHEDULES = [
+    "Every Monday at 3am",
+    "Every weekday at noon",
+    "Every 15 minutes",
+    "invalid cron string",
+    "Every weekend at 10pm",
+]
+
+
+async def stream(items):
+    for item in items:
+        yield item
+        await asyncio.sleep(0)
+
+
+async def collect(items, **kwargs):
+    return await collect_from(stream(items), **kwargs)
+
+
+async def collect_from(source, **kwargs):
+    return [result async for result in acronslate(source, **kwargs)]
+
+
+def test_cronslate_batch():
+    results = cronslate_batch(SCHEDULES, return_exceptions=True)
+    assert results[:3] == ["0 3 * * 1", "0 12 * * 1-5", "*/15 * * * *"]
+    assert isinstance(results[3], ValueError)
+    assert results[4] == "0 22 * * 0,6"
+
+    with pytest.raises(ValueError):
+        cronslate_batch(SCHEDULES)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 256])
+def test_acronslate_preserves_order(batch_size):
+    items = [s for s in SCHEDULES if s != "invalid cron string"] * 50
+    results = asyncio.run(collect(items, batch_size=batch_size, max_pending=2))
+    assert results == cronslate_batch(items)
+
+
+def test_acronslate_return_exceptions():
+    results = asyncio.run(collect(SCHEDULES, batch_size=2, return_exceptions=True))
+    assert len(results) == len(SCHEDULES)
+    assert isinstance(results[3], ValueError)
+    assert results[4] == "0 22 * * 0,6"
+
+
+def test_acronslate_raises_translation_error():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(SCHEDULES, batch_size=2))
+
+
+def test_acronslate_propagates_source_error():
+    async def broken():
+        yield "Every Monday at 3am"
+        raise RuntimeError("source failed")
+
+    async def run():
+        return [result async for result in acronslate(broken())]
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        asyncio.run(run())
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("max_pending", [1, 2, 3])
+def test_acronslate_applies_backpressure(max_pending):
+    consumed = 0
+    executor = CountingExecutor()
+
+    async def counting():
+        nonlocal consumed
+        for _ in range(1000):
+            consumed += 1
+            yield "Every 15 minutes"
+
+    async def run():
+        results = acronslate(
+            counting(), batch_size=10, max_pending=max_pending, executor=executor
+        )
+        await results.__anext__()
+        await asyncio.sleep(0.05)
+        submitted = executor.submitted
+        await results.aclose()
+        return submitted
+
+    with executor:
+        assert asyncio.run(run()) == max_pending
+    assert consumed == 10 * max_pending
+
+
+def test_acronslate_closes_source_on_early_exit():
+    closed = False
+
+    async def source():
+        nonlocal closed
+        try:
+            for _ in range(1000):
+                yield "Every 15 minutes"
+        finally:
+            closed = True
+
+    async def run():
+        results = acronslate(source(), batch_size=10)
+        await results.__anext__()
+        await results.aclose()
+
+    asyncio.run(run())
+    assert closed
+
+
+def test_acronslate_unhashable_description():
+    results = asyncio.run(
+        collect(["Every 15 minutes", ["not", "a", "string"]], return_exceptions=True)
+    )
+    assert results[0] == "*/15 * * * *"
+    assert isinstance(results[1], ValueError)
+
+
+def test_acronslate_flushes_partial_batch_after_max_delay():
+    async def pausing():
+        yield "Every 15 minutes"
+        yield "Every Monday at 3am"
+        await asyncio.sleep(10)
+        yield "Every weekend at 10pm"
+
+    async def run():
+        results = acronslate(pausing(), batch_size=256, max_delay=0.01)
+        first = await asyncio.wait_for(results.__anext__(), timeout=1)
+        second = await asyncio.wait_for(results.__anext__(), timeout=1)
+        await results.aclose()
+        return [first, second]
+
+    assert asyncio.run(run()) == ["*/15 * * * *", "0 3 * * 1"]
+
+
+def test_acronslate_keeps_late_item_after_max_delay():
+    async def slow():
+        for description in SCHEDULES:
+            yield description
+            await asyncio.sleep(0.02)
+
+    results = asyncio.run(
+        collect_from(slow(), batch_size=4, max_delay=0.005, return_exceptions=True)
+    )
+    assert [str(r) for r in results] == [
+        str(r) for r in cronslate_batch(SCHEDULES, return_exceptions=True)
+    ]
+
+
+def test_acronslate_closes_iterator_returned_by_aiter():
+    closed = False
+
+    class Descriptions:
+        def __aiter__(self):
+            return self.generate()
+
+        async def generate(self):
+            nonlocal closed
+            try:
+                for _ in range(1000):
+                    yield "Every 15 minutes"
+            finally:
+                closed = True
+
+    async def run():
+        results = acronslate(Descriptions(), batch_size=10)
+        await results.__anext__()
+        await results.aclose()
+
+    asyncio.run(run())
+    assert closed
+
+
+def test_package_import_does_not_load_asyncio():
+    code = (
+        "import sys, pyslop.cronslator as c; "
+        "assert 'asyncio' not in sys.modules; "
+        "c.acronslate; assert 'asyncio' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=ENV)
@@ -1,5 +1,8 @@
+import time
+
 import pytest
 from pyslop.cronslator import cronslate
+from pyslop.cronslator.cronslator import MAX_DESCRIPTION_LENGTH
 
 
 @pytest.mark.parametrize(
@@ -103,3 +106,46 @@ def test_advanced_schedules(description, expected):
 )
 def test_additional_schedules(description, expected):
     assert cronslate(description) == expected
+
+
+def test_description_length_cap():
+    long_description = "Every Monday at 3am" + " " * MAX_DESCRIPTION_LENGTH
+    with pytest.raises(ValueError, match="longer than"):
+        cronslate(long_description)
+    with pytest.raises(ValueError, match="longer than 10 characters"):
+        cronslate("Every Monday at 3am", max_length=10)
+    assert cronslate(long_description, max_length=None) == "0 3 * * 1"
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda n: "1" * n,
+        lambda n: "every " + "1" * n + "x",
+        lambda n: "9" * n + " x day",
+        lambda n: "1" * n + "x",
+        lambda n: "between 1" + " " * n + "x",
+    ],
+)
+def test_adversarial_input_is_fast(build):
+    # Quadratic backtracking takes minutes at this size; scaling is
+    # measured by benchmarks/bench_adversarial.py
+    description = build(100_000)
+    start = time.perf_counter()
+    try:
+        cronslate(description, max_length=None)
+    except ValueError:
+        pass
+    assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.parametrize(
+    "description,expected",
+    [
+        ("Every 10 days at noon", "0 12 */10 * *"),
+        ("Monthly on the 21st at noon", "0 12 21 * *"),
+        ("Four times per hour at 0, 15, 30 and 45", "0,15,30,45 * * * *"),
+    ],
+)
+def test_multi_digit_numbers(description, expected):
+    assert cronslate(description) == expected
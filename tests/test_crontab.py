@@ -0,0 +1,137 @@
+import io
+import sys
+from unittest.mock import patch
+
+import pytest
+from pyslop.cronslator.cli import main
+from pyslop.cronslator.crontab import annotation, regenerate_crontab
+
+
+CRONTAB = (
+    b"SHELL=/bin/sh\n"
+    b"# m h  dom mon dow   command\n"
+    b"# cronslate: every weekday at 9am\n"
+    b"0 8 * * 1-5 /usr/bin/report --daily\n"
+    b"\n"
+    b"#cronslate: Every 15 minutes\r\n"
+    b"*/15  *  *  *  *\t/usr/bin/poll\r\n"
+    b"# cronslate: nightly cleanup\n"
+    b"30 2 * * * /usr/bin/cleanup\n"
+    b"5 4 * * 0 /usr/bin/unannotated\n"
+    b"# cronslate: every weekday at 9am\n"
+    b"  1 2 3 4 5 /usr/bin/other\n"
+)
+
+EXPECTED = (
+    b"SHELL=/bin/sh\n"
+    b"# m h  dom mon dow   command\n"
+    b"# cronslate: every weekday at 9am\n"
+    b"0 9 * * 1-5 /usr/bin/report --daily\n"
+    b"\n"
+    b"#cronslate: Every 15 minutes\r\n"
+    b"*/15  *  *  *  *\t/usr/bin/poll\r\n"
+    b"# cronslate: nightly cleanup\n"
+    b"30 2 * * * /usr/bin/cleanup\n"
+    b"5 4 * * 0 /usr/bin/unannotated\n"
+    b"# cronslate: every weekday at 9am\n"
+    b"  0 9 * * 1-5 /usr/bin/other\n"
+)
+
+
+def test_regenerate_crontab():
+    output = io.BytesIO()
+    assert regenerate_crontab(io.BytesIO(CRONTAB), output) == (2, 2)
+    assert output.getvalue() == EXPECTED
+
+
+def test_regenerate_crontab_is_idempotent():
+    output = io.BytesIO()
+    assert regenerate_crontab(io.BytesIO(EXPECTED), output) == (0, 4)
+    assert output.getvalue() == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "comment",
+    [
+        b"# 0 5 * * * /old/job",
+        b"# cronslate: 0 5 * * * /old/job",
+        b"# restart web server 2",
+        b"# backup to 2nd disk",
+        b"# every weekday at 9am",
+        b"# runs at 3am, see ticket 42",
+    ],
+)
+def test_plain_and_commented_out_jobs_are_untouched(comment):
+    crontab = comment + b"\n0 6 * * * /new/job\n"
+    output = io.BytesIO()
+    assert regenerate_crontab(io.BytesIO(crontab), output) == (0, 0)
+    assert output.getvalue() == crontab
+
+
+def test_annotation():
+    assert annotation(b"cronslate: every monday at 3am") == b"every monday at 3am"
+    assert annotation(b"every monday at 3am") is None
+    assert annotation(b"cronslate:") is None
+    assert annotation(b"cronslate: */5 * * * * /usr/bin/job") is None
+
+
+def test_regenerate_crontab_reuses_cache():
+    cache = {}
+    regenerate_crontab(io.BytesIO(CRONTAB), io.BytesIO(), cache)
+    assert cache[b"every weekday at 9am"] == b"0 9 * * 1-5"
+    assert cache[b"nightly cleanup"] is None
+
+    with patch("pyslop.cronslator.crontab.cronslate") as fake_cronslate:
+        output = io.BytesIO()
+        regenerate_crontab(io.BytesIO(CRONTAB), output, cache)
+    fake_cronslate.assert_not_called()
+    assert output.getvalue() == EXPECTED
+
+
+def test_cli_crontab_mode(tmp_path, capsysbinary):
+    path = tmp_path / "crontab"
+    path.write_bytes(CRONTAB)
+
+    with patch.object(sys, "argv", ["cronslate", "--crontab", str(path)]):
+        main()
+    assert capsysbinary.readouterr().out == EXPECTED
+
+
+def test_cli_crontab_rejects_shard_options(tmp_path, capsys):
+    path = tmp_path / "crontab"
+    path.write_bytes(CRONTAB)
+    test_input = ["cronslate", "--crontab", str(path), "--offset", "5"]
+
+    with patch.object(sys, "argv", test_input):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+    assert exc_info.value.code == 2
+    assert "only apply to --file" in capsys.readouterr().err
+
+
+PLAIN_CRONTAB = (
+    b"# every weekday at 9am\n"
+    b"0 8 * * 1-5 /usr/bin/report\n"
+    b"# 0 5 * * * /old/job\n"
+    b"0 6 * * * /new/job\n"
+    b"# nightly cleanup\n"
+    b"30 2 * * * /usr/bin/cleanup\n"
+)
+
+PLAIN_EXPECTED = PLAIN_CRONTAB.replace(b"0 8 * * 1-5", b"0 9 * * 1-5")
+
+
+def test_regenerate_crontab_any_comment():
+    output = io.BytesIO()
+    assert regenerate_crontab(io.BytesIO(PLAIN_CRONTAB), output, marker=None) == (1, 1)
+    assert output.getvalue() == PLAIN_EXPECTED
+
+
+def test_cli_crontab_any_comment(tmp_path, capsysbinary):
+    path = tmp_path / "crontab"
+    path.write_bytes(PLAIN_CRONTAB)
+    test_input = ["cronslate", "--crontab", str(path), "--any-comment"]
+
+    with patch.object(sys, "argv", test_input):
+        main()
+    assert capsysbinary.readouterr().out == PLAIN_EXPECTED
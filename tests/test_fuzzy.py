@@ -0,0 +1,92 @@
+import pytest
+from pyslop.cronslator import cronslate
+from pyslop.cronslator.fuzzy import (
+    DeletionIndex,
+    correct_token,
+    correct_typos,
+    deletions,
+    osa_distance,
+)
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        ("friday", "friday", 0),
+        ("fridya", "friday", 1),
+        ("wendesday", "wednesday", 1),
+        ("wednesay", "wednesday", 1),
+        ("tuseday", "tuesday", 1),
+        ("mondya", "sunday", 3),
+        ("", "abc", 3),
+    ],
+)
+def test_osa_distance(a, b, expected):
+    assert osa_distance(a, b) == expected
+    assert osa_distance(b, a) == expected
+
+
+def test_deletions():
+    assert deletions("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert "c" in deletions("abc", 2)
+
+
+def test_deletion_index_matches_linear_scan():
+    words = ["monday", "tuesday", "wednesday", "thursday", "friday", "third"]
+    index = DeletionIndex(words, max_distance=2)
+    for token in ["fridya", "thrid", "tusday", "wednsedy", "mondays", "xyz"]:
+        expected = {
+            word: osa_distance(token, word)
+            for word in words
+            if osa_distance(token, word) <= 2
+        }
+        assert index.matches(token) == expected
+
+
+@pytest.mark.parametrize(
+    "description,expected",
+    [
+        ("Every wendesday at 3am", "0 3 * * 3"),
+        ("Every tuseday and fridya at noon", "0 12 * * 2,5"),
+        ("Frist Monday of every month at 3am", "0 3 1-7 * 1"),
+        ("Every thrid day at noon", "0 12 */3 * *"),
+        ("Every wednesdsy at 5pm", "0 17 * * 3"),
+        ("Every sevne days at noon", "0 12 */7 * *"),
+    ],
+)
+def test_cronslate_fuzzy(description, expected):
+    assert cronslate(description, fuzzy=True) == expected
+
+
+@pytest.mark.parametrize(
+    "description,expected",
+    [
+        ("Every night at 10pm", "0 22 * * *"),
+        ("Every sundae at 3pm", "0 15 * * *"),
+        ("Every day at 3pm, brush teeth", "0 15 * * *"),
+        ("Every day at 3pm, clean the filth", "0 15 * * *"),
+        ("Every day at 3pm read elven poetry", "0 15 * * *"),
+        ("Every sunday there at 4pm", "0 16 * * 0"),
+        ("Every day at 3pm for sixty users", "0 15 * * *"),
+        ("Every eighty days at noon", "0 12 * * *"),
+        ("Every seventy days", "* * * * *"),
+        ("Every mondays at 3am", "0 3 * * 1"),
+        ("On mondays and fridays at noon", "0 12 * * 1,5"),
+    ],
+)
+def test_cronslate_fuzzy_leaves_ordinary_words(description, expected):
+    assert cronslate(description, fuzzy=True) == expected
+    assert correct_typos(description.lower()) == description.lower()
+
+
+@pytest.mark.parametrize(
+    "word",
+    ["thirty", "seventy", "eighty", "ninety", "seconds", "mondays", "thirds", "there"],
+)
+def test_correct_typos_keeps_real_words(word):
+    assert correct_token(word) == word
+    assert correct_typos(f"every {word} day") == f"every {word} day"
+
+
+def test_cronslate_is_exact_by_default():
+    assert cronslate("Every wendesday at 3am") == "0 3 * * *"
@@ -0,0 +1,100 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyslop.cronslator import cronslate, cronslate_batch, cronslate_threaded
+from pyslop.cronslator.cronslator import memoize
+
+
+SCHEDULES = [
+    "Every Monday at 3am",
+    "Every weekday at noon",
+    "Every 15 minutes",
+    "Every day at 2am and 2pm",
+    "Every 30 minutes between 9am and 5pm on weekdays",
+    "First Monday of every month at 3am",
+    "Every weekend at 10pm",
+    "Last day of month at 11:59 PM",
+]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 256])
+def test_cronslate_threaded_preserves_order(chunksize):
+    descriptions = SCHEDULES * 40
+    expected = [cronslate(d) for d in descriptions]
+    for cached in [True, False]:
+        results = cronslate_threaded(
+            descriptions, max_workers=4, chunksize=chunksize, cached=cached
+        )
+        assert results == expected
+
+
+def test_cronslate_threaded_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = cronslate_threaded(iter(SCHEDULES), executor=executor, chunksize=2)
+    assert results == cronslate_batch(SCHEDULES)
+
+
+def test_cronslate_threaded_errors():
+    descriptions = SCHEDULES + ["invalid cron string"]
+    with pytest.raises(ValueError):
+        cronslate_threaded(descriptions, max_workers=2, chunksize=2)
+
+    results = cronslate_threaded(
+        descriptions, max_workers=2, chunksize=2, return_exceptions=True
+    )
+    assert results[:-1] == cronslate_batch(SCHEDULES)
+    assert isinstance(results[-1], ValueError)
+
+
+def test_memoize_concurrent_fill_and_evict():
+    # A memo far smaller than the key space evicts on almost every call,
+    # so threads constantly insert and evict while others read
+    @memoize(maxsize=4)
+    def double(x):
+        return x * 2
+
+    errors = []
+    sizes = []
+
+    def worker(offset):
+        try:
+            for i in range(5000):
+                key = (i + offset) % 64
+                if double(key) != key * 2:
+                    errors.append(key)
+                sizes.append(double.cache_len())
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    # At most one entry over the limit per thread racing past the size check
+    assert max(sizes) <= 4 + len(threads)
+    double(1000)
+    assert double.cache_len() <= 4
+
+
+def test_memoize_evicts_oldest():
+    calls = []
+
+    @memoize(maxsize=2)
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert [double(1), double(1), double(2), double(3), double(1)] == [2, 2, 4, 6, 2]
+    assert calls == [1, 2, 3, 1]
+    # 3 survived the eviction of 2, so it is still memoized
+    assert double(3) == 6
+    assert calls == [1, 2, 3, 1]
@@ -0,0 +1,98 @@
+import io
+import sys
+from unittest.mock import patch
+
+import pytest
+from pyslop.cronslator.cli import main
+from pyslop.cronslator.streaming import translate_file
+
+
+SCHEDULES = [
+    "Every Monday at 3am",
+    "Every weekday at noon",
+    "invalid cron string",
+    "",
+    "Every 15 minutes",
+    "Every weekend at 10pm",
+]
+
+
+@pytest.fixture
+def schedule_file(tmp_path):
+    path = tmp_path / "schedules.txt"
+    path.write_text("\n".join(SCHEDULES) + "\n")
+    return path
+
+
+def test_translate_file(schedule_file):
+    output = io.BytesIO()
+    assert translate_file(str(schedule_file), output) == (4, 1)
+    assert output.getvalue().decode().splitlines() == [
+        "0 3 * * 1",
+        "0 12 * * 1-5",
+        "Error: Invalid time specification",
+        "*/15 * * * *",
+        "0 22 * * 0,6",
+    ]
+
+
+def test_translate_file_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    output = io.BytesIO()
+    assert translate_file(str(path), output) == (0, 0)
+    assert output.getvalue() == b""
+
+
+@pytest.mark.parametrize("shard_size", [1, 7, 20, 33, 1000])
+def test_shards_cover_every_line_once(schedule_file, shard_size):
+    expected = io.BytesIO()
+    translate_file(str(schedule_file), expected)
+
+    combined = b""
+    size = schedule_file.stat().st_size
+    for offset in range(0, size, shard_size):
+        output = io.BytesIO()
+        translate_file(str(schedule_file), output, offset, shard_size)
+        combined += output.getvalue()
+    assert combined == expected.getvalue()
+
+
+def test_cli_file_mode(schedule_file, capsysbinary):
+    test_input = ["cronslate", "--file", str(schedule_file), "--length", "21"]
+
+    with patch.object(sys, "argv", test_input):
+        main()
+    assert capsysbinary.readouterr().out == b"0 3 * * 1\n0 12 * * 1-5\n"
+
+
+def test_cli_file_mode_missing_file(tmp_path, capsys):
+    test_input = ["cronslate", "--file", str(tmp_path / "missing.txt")]
+
+    with patch.object(sys, "argv", test_input):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+    assert exc_info.value.code == 1
+    assert "Error:" in capsys.readouterr().err
+
+
+def test_translate_file_with_offsets(schedule_file):
+    data = schedule_file.read_bytes()
+    output = io.BytesIO()
+    translate_file(str(schedule_file), output, offset=20, with_offsets=True)
+    lines = output.getvalue().decode().splitlines()
+    assert lines[0] == "20\t0 12 * * 1-5"
+    # Each offset points at the start of the line it was translated from
+    for line, schedule in zip(lines, [s for s in SCHEDULES[1:] if s]):
+        position = int(line.split("\t")[0])
+        assert data[position - 1 : position] == b"\n"
+        assert data[position:].startswith(schedule.encode())
+
+
+def test_cli_file_mode_offsets(schedule_file, capsysbinary):
+    test_input = ["cronslate", "--file", str(schedule_file), "--offsets"]
+
+    with patch.object(sys, "argv", test_input):
+        with pytest.raises(SystemExit):
+            main()
+    assert capsysbinary.readouterr().out.startswith(b"0\t0 3 * * 1\n20\t")